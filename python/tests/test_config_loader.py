@@ -0,0 +1,62 @@
+"""
+Config Loader Tests
+
+The parsed config is memoized and shared between the loader helpers, so the
+dictionaries they hand out must be independent copies.
+
+No network access required.
+"""
+
+import os
+
+import yaml
+
+from unicefdata.config_loader import get_cached_config, load_categories, load_dataflows
+
+
+def _write_config(path):
+    path.write_text(yaml.safe_dump({
+        "indicators": {},
+        "dataflows": {"CME": {"name": "Child Mortality", "version": "1.0"}},
+        "categories": {"mortality": {"name": "Mortality", "indicators": ["CME_MRY0T4"]}},
+    }), encoding="utf-8")
+
+
+def test_load_dataflows_returns_independent_copies(tmp_path):
+    config = tmp_path / "indicators.yaml"
+    _write_config(config)
+
+    load_dataflows(config)["CME"]["name"] = "changed"
+
+    assert load_dataflows(config)["CME"]["name"] == "Child Mortality"
+
+
+def test_load_categories_returns_independent_copies(tmp_path):
+    config = tmp_path / "indicators.yaml"
+    _write_config(config)
+
+    load_categories(config)["mortality"]["indicators"].append("X")
+
+    assert load_categories(config)["mortality"]["indicators"] == ["CME_MRY0T4"]
+
+
+def test_get_cached_config_returns_independent_copies(tmp_path):
+    config = tmp_path / "indicators.yaml"
+    _write_config(config)
+
+    get_cached_config(config)["dataflows"]["CME"]["name"] = "changed"
+
+    assert get_cached_config(config)["dataflows"]["CME"]["name"] == "Child Mortality"
+
+
+def test_get_cached_config_picks_up_file_changes(tmp_path):
+    config = tmp_path / "indicators.yaml"
+    _write_config(config)
+    assert "CME" in get_cached_config(config)["dataflows"]
+
+    config.write_text(yaml.safe_dump({"dataflows": {"NUTRITION": {}}}), encoding="utf-8")
+    # Force a distinct mtime even on filesystems with coarse timestamps
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert list(get_cached_config(config)["dataflows"]) == ["NUTRITION"]
@@ -203,3 +203,24 @@ class TestDataTypes:
         df = pd.read_csv(FIXTURES / fixture)
         assert (df["REF_AREA"].str.len() == 3).all(), \
             f"REF_AREA should be 3-char ISO3 codes in {fixture}"
+
+
+# ===========================================================================
+# Cache writes: interrupted YAML write must not corrupt the existing file
+# ===========================================================================
+
+class TestAtomicYamlWrite:
+    """write_yaml_atomic should leave the previous file intact on failure."""
+
+    def test_failed_dump_keeps_original(self, tmp_path):
+        import yaml
+        from unicefdata.utils import write_yaml_atomic
+
+        target = tmp_path / "cache.yaml"
+        write_yaml_atomic(target, {"version": 1})
+
+        with pytest.raises(yaml.representer.RepresenterError):
+            write_yaml_atomic(target, {"version": object()}, Dumper=yaml.SafeDumper)
+
+        assert yaml.safe_load(target.read_text(encoding="utf-8")) == {"version": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.yaml"]
@@ -0,0 +1,60 @@
+"""
+Logging Configuration Tests
+
+Importing the package must not override logging that the application set up
+beforehand. Each case runs in a fresh interpreter so the import is real.
+
+No network access required.
+"""
+
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PYTHON_DIR = Path(__file__).resolve().parent.parent
+
+
+def _levels_after_import(setup: str, after: str = "") -> list:
+    """Return [package effective level, root level] after `setup` + import + `after`."""
+    code = (
+        "import logging\n"
+        f"{setup}\n"
+        "import unicefdata\n"
+        f"{after}\n"
+        "print(logging.getLogger('unicefdata.sdmx_client').getEffectiveLevel(),"
+        " logging.getLogger().level)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PYTHON_DIR, capture_output=True, text=True, check=True,
+    )
+    return [int(v) for v in out.stdout.split()[-2:]]
+
+
+@pytest.mark.parametrize("level", ["DEBUG", "WARNING"])
+def test_preconfigured_level_is_kept(level):
+    """A level configured before import stays in effect for the package."""
+    expected = getattr(logging, level)
+    assert _levels_after_import(f"logging.basicConfig(level=logging.{level})") == [
+        expected, expected,
+    ]
+
+
+def test_default_shows_package_info_only():
+    """Without prior setup, the package logs INFO but the root stays at WARNING."""
+    assert _levels_after_import("") == [logging.INFO, logging.WARNING]
+
+
+def test_package_logger_can_be_quieted_after_import():
+    """Setting the 'unicefdata' logger's level after import takes effect."""
+    after = "logging.getLogger('unicefdata').setLevel(logging.WARNING)"
+    assert _levels_after_import("", after) == [logging.WARNING, logging.WARNING]
+
+
+def test_root_level_after_import_does_not_reach_package_logger():
+    """The package logger has its own level, so a later root change leaves it at INFO."""
+    after = "logging.getLogger().setLevel(logging.ERROR)"
+    assert _levels_after_import("", after) == [logging.INFO, logging.ERROR]
@@ -27,6 +27,13 @@ class TestMetadataManager(unittest.TestCase):
         self.assertIn('TIME_PERIOD', mapping)
         self.assertEqual(mapping['TIME_PERIOD'], 'period')
 
+    def test_get_column_mapping_cached(self):
+        mapping = self.manager.get_column_mapping('CME')
+        self.assertIn('CME', self.manager.column_mappings)
+        # Callers get their own copy; mutating it must not affect the cache
+        mapping['REF_AREA'] = 'changed'
+        self.assertEqual(self.manager.get_column_mapping('CME')['REF_AREA'], 'iso3')
+
     def test_validate_dataframe(self):
         data = {
             'REF_AREA': ['AFG'],
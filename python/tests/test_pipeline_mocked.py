@@ -190,3 +190,100 @@ class TestPipelineColumnOrder:
 
         assert "indicator" in df.columns
         assert "CME_MRY0T4" in df["indicator"].values
+
+
+class TestPipelineMultiIndicator:
+    """Tests for fetching several indicators in one unicefData() call"""
+
+    DATA_URL = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/data"
+
+    @staticmethod
+    def _add_data_callback(pattern, body, status=200, wait_for=None, calls=None, done=None):
+        """Mock one indicator's data endpoint, recording (pattern, thread) per call.
+
+        The response is held until `wait_for` is set (plus a short grace period),
+        and `done` is set once the request has been seen.
+        """
+        import re
+        import threading
+        import time
+
+        def callback(request):
+            if calls is not None:
+                calls.append((pattern, threading.current_thread()))
+            if done is not None:
+                done.set()
+            if wait_for is not None:
+                wait_for.wait(timeout=30)
+                time.sleep(0.5)
+            return status, {}, body
+
+        responses.add_callback(
+            responses.GET,
+            re.compile(rf"{re.escape(TestPipelineMultiIndicator.DATA_URL)}/UNICEF,.*{pattern}.*"),
+            callback=callback,
+            content_type="text/csv",
+        )
+
+    @responses.activate
+    def test_results_keep_requested_order(self, mock_csv_nutrition, mock_csv_valid_cme):
+        """Indicators come back in the requested order even if the first finishes last"""
+        import threading
+
+        second_done = threading.Event()
+        self._add_data_callback("NT_ANT_HAZ_NE2", mock_csv_nutrition, wait_for=second_done)
+        self._add_data_callback("CME_MRY0T4", mock_csv_valid_cme, done=second_done)
+
+        df = unicefData(
+            indicator=["NT_ANT_HAZ_NE2", "CME_MRY0T4"],
+            dataflow="NUTRITION",
+            max_workers=2,
+        )
+
+        assert list(df["indicator"].drop_duplicates()) == ["NT_ANT_HAZ_NE2", "CME_MRY0T4"]
+
+    @responses.activate
+    def test_failure_propagates_and_skips_queued_fetches(self, mock_csv_valid_cme):
+        """A failing indicator raises and indicators not yet started are not fetched"""
+        import threading
+
+        import pytest
+        from unicefdata.sdmx_client import SDMXBadRequestError
+
+        calls = []
+        failed = threading.Event()
+        self._add_data_callback("BAD_A", "bad request", status=400, calls=calls, done=failed)
+        self._add_data_callback("CME_MRY0T4", mock_csv_valid_cme, wait_for=failed, calls=calls)
+        self._add_data_callback("IM_DTP3", mock_csv_valid_cme, calls=calls)
+
+        with pytest.raises(SDMXBadRequestError):
+            unicefData(
+                indicator=["BAD_A", "CME_MRY0T4", "IM_DTP3"],
+                dataflow="CME",
+                max_workers=2,
+            )
+
+        assert "IM_DTP3" not in [pattern for pattern, _ in calls]
+
+    @responses.activate
+    def test_max_workers_one_is_sequential(self, mock_csv_vaccination, mock_csv_valid_cme):
+        """max_workers=1 fetches in the calling thread and stops at the first failure"""
+        import threading
+
+        import pytest
+        from unicefdata.sdmx_client import SDMXBadRequestError
+
+        calls = []
+        self._add_data_callback("IM_DTP3", mock_csv_vaccination, calls=calls)
+        self._add_data_callback("BAD_A", "bad request", status=400, calls=calls)
+        self._add_data_callback("CME_MRY0T4", mock_csv_valid_cme, calls=calls)
+
+        with pytest.raises(SDMXBadRequestError):
+            unicefData(
+                indicator=["IM_DTP3", "BAD_A", "CME_MRY0T4"],
+                dataflow="IMMUNISATION",
+                max_workers=1,
+            )
+
+        assert [pattern for pattern, _ in calls] == ["IM_DTP3", "BAD_A"]
+        assert all(thread is threading.main_thread() for _, thread in calls)
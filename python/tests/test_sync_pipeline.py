@@ -228,3 +228,32 @@ class TestCrossFormatConsistency:
             assert xml_data[code]["name"] == yaml_data[code]["name"], (
                 f"Name mismatch for {code}: XML={xml_data[code]['name']}, YAML={yaml_data[code]['name']}"
             )
+
+
+# ===========================================================================
+# SYNC-13: Streamed CSV sampling
+# ===========================================================================
+
+class TestSampleDataStreaming:
+    """get_sample_data() parses the streamed CSV body like a full read."""
+
+    @responses.activate
+    def test_sync13_quoted_multiline_field_keeps_newline(self):
+        """SYNC-13: A quoted field spanning lines keeps its line break."""
+        body = (
+            "REF_AREA,SEX,COUNTRY_NOTES\r\n"
+            'USA,_T,"line1\nline2"\r\n'
+            "BRA,F,plain\r\n"
+        )
+        responses.add(
+            responses.GET,
+            re.compile(r".*sdmx\.data\.unicef\.org.*data/UNICEF,CME.*"),
+            body=body,
+            status=200,
+            content_type="text/csv",
+        )
+        from unicefdata.schema_sync import get_sample_data
+        result = get_sample_data("CME", max_retries=1)
+
+        assert set(result["REF_AREA"]["values"]) == {"USA", "BRA"}
+        assert "line1\nline2" in result["COUNTRY_NOTES"]["values"]
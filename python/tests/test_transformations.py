@@ -118,6 +118,49 @@ class TestCleanDataframe:
         if "geo_type" in cleaned.columns:
             assert (cleaned["geo_type"] == 0).all(), "USA should have geo_type=0"
 
+    def test_period_formats(self):
+        """TIME_PERIOD strings convert to decimal years; malformed ones to NaN."""
+        from unicefdata.sdmx_client import UNICEFSDMXClient
+        client = UNICEFSDMXClient()
+
+        periods = {
+            "2010": 2010.0,
+            "2006-11": 2006 + 11 / 12,
+            "2006-01-15": 2006 + 1 / 12,
+            "2014-5": 2014 + 5 / 12,
+            "2014-5-01": 2014 + 5 / 12,
+            " 2013-05": 2013 + 5 / 12,
+            "2006-Q1": None,
+            "2015-2019": None,
+        }
+        df = pd.DataFrame({
+            "REF_AREA": "USA",
+            "INDICATOR": "CME_MRY0T4",
+            "TIME_PERIOD": list(periods),
+            "OBS_VALUE": range(len(periods)),
+        })
+        cleaned = client._clean_dataframe(
+            df, indicator_code="CME_MRY0T4", sex_filter=None, dropna=False
+        )
+
+        assert len(cleaned) == len(periods)
+        by_value = dict(zip(cleaned["value"], cleaned["period"]))
+        for i, (raw, expected) in enumerate(periods.items()):
+            if expected is None:
+                assert pd.isna(by_value[i]), f"{raw!r} should not convert"
+            else:
+                assert by_value[i] == pytest.approx(expected), raw
+
+    def test_enrichment_metadata_loaded_once(self):
+        """Enrichment YAML should be parsed once and reused across cleans."""
+        from unicefdata.sdmx_client import UNICEFSDMXClient
+        client = UNICEFSDMXClient()
+
+        first = client._load_indicators_metadata_for_enrichment()
+        assert client._load_indicators_metadata_for_enrichment() is first
+        countries = client._load_countries_metadata_for_enrichment()
+        assert client._load_countries_metadata_for_enrichment() is countries
+
 
 # ===========================================================================
 # TRANS-02: Latest and MRV filters
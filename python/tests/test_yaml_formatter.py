@@ -0,0 +1,79 @@
+"""
+YAML Formatter Tests
+
+format_file() only rewrites its output when the formatted content differs,
+so already-normalized files keep their modification time.
+
+No network access required.
+"""
+
+import os
+
+from unicefdata.yaml_formatter import YAMLFormatter
+
+# Well in the past, so a rewrite is always visible in st_mtime_ns
+OLD_MTIME_NS = 1_000_000_000 * 10**9
+
+
+def _set_old_mtime(path):
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def test_format_file_twice_keeps_mtime(tmp_path):
+    path = tmp_path / "flows.yaml"
+    path.write_text("b:   1\na: [x,   y]\n", encoding="utf-8")
+    formatter = YAMLFormatter()
+
+    formatter.format_file(path)
+    formatted = path.read_text(encoding="utf-8")
+    _set_old_mtime(path)
+    formatter.format_file(path)
+
+    assert path.read_text(encoding="utf-8") == formatted
+    assert path.stat().st_mtime_ns == OLD_MTIME_NS
+
+
+def test_format_file_rewrites_unformatted_input(tmp_path):
+    path = tmp_path / "flows.yaml"
+    path.write_text("b:   1\na: [x,   y]\n", encoding="utf-8")
+    _set_old_mtime(path)
+
+    YAMLFormatter().format_file(path)
+
+    assert path.stat().st_mtime_ns != OLD_MTIME_NS
+    assert path.read_text(encoding="utf-8") == YAMLFormatter().dumps({"b": 1, "a": ["x", "y"]})
+
+
+def test_format_file_writes_differing_output_path(tmp_path):
+    source = tmp_path / "source.yaml"
+    target = tmp_path / "target.yaml"
+    source.write_text("a: 1\n", encoding="utf-8")
+    target.write_text("stale: true\n", encoding="utf-8")
+    _set_old_mtime(target)
+
+    YAMLFormatter().format_file(source, target)
+
+    assert target.read_text(encoding="utf-8") == YAMLFormatter().dumps({"a": 1})
+    assert target.stat().st_mtime_ns != OLD_MTIME_NS
+
+
+def test_format_file_keeps_matching_output_path(tmp_path):
+    source = tmp_path / "source.yaml"
+    target = tmp_path / "target.yaml"
+    source.write_text("a:    1\n", encoding="utf-8")
+    target.write_text(YAMLFormatter().dumps({"a": 1}), encoding="utf-8")
+    _set_old_mtime(target)
+
+    YAMLFormatter().format_file(source, target)
+
+    assert target.stat().st_mtime_ns == OLD_MTIME_NS
+
+
+def test_format_file_creates_missing_output_path(tmp_path):
+    source = tmp_path / "source.yaml"
+    target = tmp_path / "target.yaml"
+    source.write_text("a: 1\n", encoding="utf-8")
+
+    YAMLFormatter().format_file(source, target)
+
+    assert target.read_text(encoding="utf-8") == YAMLFormatter().dumps({"a": 1})
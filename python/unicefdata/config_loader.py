@@ -6,11 +6,14 @@ Loads indicator and dataflow configurations from the shared YAML config file.
 This ensures R and Python packages use identical indicator definitions.
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from unicefdata.utils import clear_yaml_cache, load_yaml_cached
+
 
 def get_shared_indicators_path() -> Path:
     """Get path to the shared common_indicators.yaml config file.
@@ -143,6 +146,17 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
         return yaml.safe_load(f)
 
 
+def _load_config_shared(config_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load the configuration for read-only use by the helpers below.
+    
+    Unlike load_config(), the returned dictionary is shared between calls
+    and must not be modified.
+    """
+    if config_path is None:
+        config_path = get_config_path()
+    return load_yaml_cached(config_path)
+
+
 def load_indicators(config_path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
     """Load indicator definitions from shared config.
     
@@ -158,7 +172,7 @@ def load_indicators(config_path: Optional[Path] = None) -> Dict[str, Dict[str, A
         ...
     }
     """
-    config = load_config(config_path)
+    config = _load_config_shared(config_path)
     indicators = config.get('indicators', {})
     
     # Transform to COMMON_INDICATORS format (rename sdg_target to sdg)
@@ -179,14 +193,15 @@ def load_indicators(config_path: Optional[Path] = None) -> Dict[str, Dict[str, A
 
 def load_dataflows(config_path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
     """Load dataflow definitions from shared config."""
-    config = load_config(config_path)
-    return config.get('dataflows', {})
+    config = _load_config_shared(config_path)
+    # Deep copy: the parsed config is shared through the lru_cache
+    return copy.deepcopy(config.get('dataflows', {}))
 
 
 def load_categories(config_path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
     """Load category definitions from shared config."""
-    config = load_config(config_path)
-    return config.get('categories', {})
+    config = _load_config_shared(config_path)
+    return copy.deepcopy(config.get('categories', {}))
 
 
 def get_indicators_by_category(
@@ -201,7 +216,7 @@ def get_indicators_by_category(
     Returns:
         List of indicator codes in that category
     """
-    config = load_config(config_path)
+    config = _load_config_shared(config_path)
     indicators = config.get('indicators', {})
     
     return [
@@ -222,7 +237,7 @@ def get_indicators_by_sdg(
     Returns:
         List of indicator codes for that SDG
     """
-    config = load_config(config_path)
+    config = _load_config_shared(config_path)
     indicators = config.get('indicators', {})
     
     return [
@@ -243,7 +258,7 @@ def get_indicators_by_dataflow(
     Returns:
         List of indicator codes in that dataflow
     """
-    config = load_config(config_path)
+    config = _load_config_shared(config_path)
     indicators = config.get('indicators', {})
     
     return [
@@ -252,19 +267,12 @@ def get_indicators_by_dataflow(
     ]
 
 
-# Module-level cached config
-_cached_config = None
-
-
 def get_cached_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Get cached configuration (loads once, reuses thereafter)."""
-    global _cached_config
-    if _cached_config is None:
-        _cached_config = load_config(config_path)
-    return _cached_config
+    """Get cached configuration (parsed once, re-read when the file changes)."""
+    # Deep copy: the parsed config is shared through the YAML cache
+    return copy.deepcopy(_load_config_shared(config_path))
 
 
 def clear_config_cache():
     """Clear the cached configuration."""
-    global _cached_config
-    _cached_config = None
+    clear_yaml_cache()
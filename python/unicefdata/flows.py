@@ -1,7 +1,12 @@
+import os
 import pandas as pd
 import requests
+import yaml
 import xml.etree.ElementTree as ET
 import time
+from pathlib import Path
+
+from unicefdata.utils import load_yaml_cached
 
 def list_dataflows(max_retries: int = 3) -> pd.DataFrame:
     """
@@ -28,18 +33,21 @@ def list_dataflows(max_retries: int = 3) -> pd.DataFrame:
             
             # Extract dataflows
             ns = {'s': 'http://www.sdmx.org/resources/sdmxml/schemas/v2_1/structure'}
-            dataflows = []
+            ids, agencies, versions, names = [], [], [], []
             
             for df in root.findall('.//s:Dataflow', ns):
                 name_elem = df.find('.//s:Name', ns)
-                dataflows.append({
-                    'id': df.get('id'),
-                    'agency': df.get('agencyID'),
-                    'version': df.get('version'),
-                    'name': name_elem.text if name_elem is not None else ''
-                })
+                ids.append(df.get('id'))
+                agencies.append(df.get('agencyID'))
+                versions.append(df.get('version'))
+                names.append(name_elem.text if name_elem is not None else '')
             
-            return pd.DataFrame(dataflows)
+            return pd.DataFrame({
+                'id': ids,
+                'agency': agencies,
+                'version': versions,
+                'name': names,
+            })
             
         except Exception as e:
             if attempt == max_retries - 1:
@@ -71,10 +79,6 @@ def dataflow_schema(dataflow: str, metadata_dir: str = None) -> dict:
         >>> print(schema['attributes'])
         ['DATA_SOURCE', 'COUNTRY_NOTES', 'REF_PERIOD', ...]
     """
-    import yaml
-    from pathlib import Path
-    import os
-    
     df_upper = dataflow.upper()
     
     # Find metadata directory
@@ -94,9 +98,8 @@ def dataflow_schema(dataflow: str, metadata_dir: str = None) -> dict:
             f"Dataflow '{df_upper}' not found. Use list_dataflows() to see available dataflows."
         )
     
-    # Parse YAML schema
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = yaml.safe_load(f)
+    # Parse YAML schema (memoized; re-read only when the file changes)
+    schema = load_yaml_cached(schema_path)
     
     # Extract dimensions (list of id values)
     dimensions = []
@@ -131,42 +134,35 @@ def print_dataflow_schema(schema: dict) -> None:
         >>> schema = dataflow_schema("CME")
         >>> print_dataflow_schema(schema)
     """
-    print()
-    print("-" * 70)
-    print(f"Dataflow Schema: {schema['id']}")
-    print("-" * 70)
-    print()
+    rule = "-" * 70
+    lines = ["", rule, f"Dataflow Schema: {schema['id']}", rule, ""]
     
     if schema.get('name'):
-        print(f"Name: {schema['name']}")
+        lines.append(f"Name: {schema['name']}")
     if schema.get('version'):
-        print(f"Version: {schema['version']}")
+        lines.append(f"Version: {schema['version']}")
     if schema.get('agency'):
-        print(f"Agency: {schema['agency']}")
-    print()
+        lines.append(f"Agency: {schema['agency']}")
+    lines.append("")
     
     dims = schema.get('dimensions', [])
     if dims:
-        print(f"Dimensions ({len(dims)}):")
-        for d in dims:
-            print(f"  {d}")
-        print()
+        lines.append(f"Dimensions ({len(dims)}):")
+        lines.extend(f"  {d}" for d in dims)
+        lines.append("")
     
     attrs = schema.get('attributes', [])
     if attrs:
-        print(f"Attributes ({len(attrs)}):")
-        for a in attrs:
-            print(f"  {a}")
+        lines.append(f"Attributes ({len(attrs)}):")
+        lines.extend(f"  {a}" for a in attrs)
     
-    print()
-    print("-" * 70)
+    lines.extend(["", rule])
+    # Emit the whole block with one write instead of one print() per line
+    print("\n".join(lines))
 
 
 def _find_metadata_dir() -> str:
     """Find metadata directory. Returns path as string."""
-    from pathlib import Path
-    import os
-    
     # 1. Environment override
     env_home = os.environ.get('UNICEF_DATA_HOME_PYTHON') or os.environ.get('UNICEF_DATA_HOME', '')
     if env_home:
@@ -194,9 +190,6 @@ def _find_metadata_dir() -> str:
 
 def _get_basic_dataflow_info(dataflow: str, metadata_path) -> dict:
     """Get basic dataflow info from _unicefdata_dataflows.yaml."""
-    import yaml
-    from pathlib import Path
-    
     df_file = Path(metadata_path) / "_unicefdata_dataflows.yaml"
     if not df_file.exists():
         return None
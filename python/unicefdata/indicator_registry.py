@@ -33,6 +33,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 from xml.etree import ElementTree as ET
 
+from unicefdata.utils import write_yaml_atomic
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -46,6 +48,71 @@ CODELIST_URL = "https://sdmx.data.unicef.org/ws/public/sdmxapi/rest/codelist/UNI
 CACHE_FILENAME = "unicef_indicators_metadata.yaml"
 CACHE_MAX_AGE_DAYS = 30  # Refresh cache if older than this
 
+# Known dataflow overrides (optimization to avoid 404 errors)
+# These are indicators where the API metadata reports the wrong dataflow.
+# Even if we remove these, the fallback logic in unicefData() would still work,
+# but this saves an unnecessary failed API request.
+KNOWN_CORRECT_DATAFLOWS = {
+    # Child Marriage - metadata says PT but data is in PT_CM
+    'PT_F_20-24_MRD_U18_TND': 'PT_CM',
+    'PT_F_20-24_MRD_U15': 'PT_CM',
+    # FGM - metadata says PT but data is in PT_FGM
+    'PT_F_15-49_FGM': 'PT_FGM',
+    'PT_F_0-14_FGM': 'PT_FGM',
+    'PT_F_15-19_FGM_TND': 'PT_FGM',
+    'PT_F_15-49_FGM_TND': 'PT_FGM',
+    'PT_F_15-49_FGM_ELIM': 'PT_FGM',
+    'PT_M_15-49_FGM_ELIM': 'PT_FGM',
+    # Education UIS SDG indicators - metadata says EDUCATION but data is in EDUCATION_UIS_SDG
+    'ED_CR_L1_UIS_MOD': 'EDUCATION_UIS_SDG',
+    'ED_CR_L2_UIS_MOD': 'EDUCATION_UIS_SDG',
+    'ED_CR_L3_UIS_MOD': 'EDUCATION_UIS_SDG',
+    'ED_ROFST_L1_UIS_MOD': 'EDUCATION_UIS_SDG',
+    'ED_ROFST_L2_UIS_MOD': 'EDUCATION_UIS_SDG',
+    'ED_ROFST_L3_UIS_MOD': 'EDUCATION_UIS_SDG',
+    'ED_ANAR_L02': 'EDUCATION_UIS_SDG',
+    'ED_MAT_G23': 'EDUCATION_UIS_SDG',
+    'ED_MAT_L1': 'EDUCATION_UIS_SDG',
+    'ED_MAT_L2': 'EDUCATION_UIS_SDG',
+    'ED_READ_G23': 'EDUCATION_UIS_SDG',
+    'ED_READ_L1': 'EDUCATION_UIS_SDG',
+    'ED_READ_L2': 'EDUCATION_UIS_SDG',
+    'PV_CHLD_DPRV-S-L1-HS': 'CHLD_PVTY',
+}
+
+# =========================================================================
+# DEPRECATED: PREFIX_TO_CATEGORY
+# =========================================================================
+# These mappings are for ORGANIZATIONAL CATEGORY ONLY, not dataflow detection.
+# For dataflow detection, use get_dataflow_for_indicator() which implements
+# the canonical fallback sequences from _dataflow_fallback_sequences.yaml.
+#
+# WARNING: Category != Dataflow. For example:
+#   - WS_HCF_* -> category=WASH, but dataflow=WASH_HEALTHCARE_FACILITY
+#   - WS_SCH_* -> category=WASH, but dataflow=WASH_SCHOOLS
+# =========================================================================
+PREFIX_TO_CATEGORY = {
+    'CME': 'CME',
+    'NT': 'NUTRITION',
+    'IM': 'IMMUNISATION',
+    'ED': 'EDUCATION',
+    'WS': 'WASH',  # Category only - NOT dataflow (could be WASH_HOUSEHOLDS, WASH_SCHOOLS, WASH_HEALTHCARE_FACILITY)
+    'HVA': 'HIV_AIDS',
+    'MNCH': 'MNCH',
+    'PT': 'PT',
+    'ECD': 'ECD',
+    'DM': 'DM',
+    'ECON': 'ECON',
+    'GN': 'GENDER',
+    'MG': 'MIGRATION',
+    'FD': 'FUNCTIONAL_DIFF',
+    'PP': 'POPULATION',
+    'EMPH': 'EMPH',
+    'EDUN': 'EDUCATION',
+    'SDG4': 'EDUCATION_UIS_SDG',
+    'PV': 'CHLD_PVTY',
+}
+
 
 def _get_cache_path() -> Path:
     """Get path to the indicator cache file.
@@ -192,40 +259,7 @@ def _infer_category(indicator_code: str) -> str:
         if dataflows_to_try:
             return dataflows_to_try[0]
     
-    # =========================================================================
-    # DEPRECATED: PREFIX_TO_CATEGORY
-    # =========================================================================
-    # These mappings are for ORGANIZATIONAL CATEGORY ONLY, not dataflow detection.
-    # For dataflow detection, use get_dataflow_for_indicator() which implements
-    # the canonical fallback sequences from _dataflow_fallback_sequences.yaml.
-    #
-    # WARNING: Category != Dataflow. For example:
-    #   - WS_HCF_* -> category=WASH, but dataflow=WASH_HEALTHCARE_FACILITY
-    #   - WS_SCH_* -> category=WASH, but dataflow=WASH_SCHOOLS
-    # =========================================================================
-    PREFIX_TO_CATEGORY = {
-        'CME': 'CME',
-        'NT': 'NUTRITION',
-        'IM': 'IMMUNISATION',
-        'ED': 'EDUCATION',
-        'WS': 'WASH',  # Category only - NOT dataflow (could be WASH_HOUSEHOLDS, WASH_SCHOOLS, WASH_HEALTHCARE_FACILITY)
-        'HVA': 'HIV_AIDS',
-        'MNCH': 'MNCH',
-        'PT': 'PT',
-        'ECD': 'ECD',
-        'DM': 'DM',
-        'ECON': 'ECON',
-        'GN': 'GENDER',
-        'MG': 'MIGRATION',
-        'FD': 'FUNCTIONAL_DIFF',
-        'PP': 'POPULATION',
-        'EMPH': 'EMPH',
-        'EDUN': 'EDUCATION',
-        'SDG4': 'EDUCATION_UIS_SDG',
-        'PV': 'CHLD_PVTY',
-    }
-    
-    # Try to match prefix from category mapping
+    # Try to match prefix from (deprecated) PREFIX_TO_CATEGORY
     if prefix in PREFIX_TO_CATEGORY:
         return PREFIX_TO_CATEGORY[prefix]
     
@@ -319,8 +353,10 @@ def _save_cache(indicators: Dict[str, dict]) -> None:
     }
     
     try:
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False, width=10000)
+        write_yaml_atomic(
+            cache_path, data,
+            default_flow_style=False, allow_unicode=True, sort_keys=False, width=10000,
+        )
         
         logger.info(f"Saved {len(indicators)} indicators to {cache_path}")
         
@@ -436,37 +472,6 @@ def get_dataflow_for_indicator(indicator_code: str, default: str = "GLOBAL_DATAF
         'GLOBAL_DATAFLOW'
     """
     # FIRST: Check known overrides (optimization to avoid 404 errors)
-    # These are indicators where the API metadata reports the wrong dataflow.
-    # Even if we remove these, the fallback logic in unicefData() would still work,
-    # but this saves an unnecessary failed API request.
-    KNOWN_CORRECT_DATAFLOWS = {
-        # Child Marriage - metadata says PT but data is in PT_CM
-        'PT_F_20-24_MRD_U18_TND': 'PT_CM',
-        'PT_F_20-24_MRD_U15': 'PT_CM',
-        # FGM - metadata says PT but data is in PT_FGM
-        'PT_F_15-49_FGM': 'PT_FGM',
-        'PT_F_0-14_FGM': 'PT_FGM',
-        'PT_F_15-19_FGM_TND': 'PT_FGM',
-        'PT_F_15-49_FGM_TND': 'PT_FGM',
-        'PT_F_15-49_FGM_ELIM': 'PT_FGM',
-        'PT_M_15-49_FGM_ELIM': 'PT_FGM',
-        # Education UIS SDG indicators - metadata says EDUCATION but data is in EDUCATION_UIS_SDG
-        'ED_CR_L1_UIS_MOD': 'EDUCATION_UIS_SDG',
-        'ED_CR_L2_UIS_MOD': 'EDUCATION_UIS_SDG',
-        'ED_CR_L3_UIS_MOD': 'EDUCATION_UIS_SDG',
-        'ED_ROFST_L1_UIS_MOD': 'EDUCATION_UIS_SDG',
-        'ED_ROFST_L2_UIS_MOD': 'EDUCATION_UIS_SDG',
-        'ED_ROFST_L3_UIS_MOD': 'EDUCATION_UIS_SDG',
-        'ED_ANAR_L02': 'EDUCATION_UIS_SDG',
-        'ED_MAT_G23': 'EDUCATION_UIS_SDG',
-        'ED_MAT_L1': 'EDUCATION_UIS_SDG',
-        'ED_MAT_L2': 'EDUCATION_UIS_SDG',
-        'ED_READ_G23': 'EDUCATION_UIS_SDG',
-        'ED_READ_L1': 'EDUCATION_UIS_SDG',
-        'ED_READ_L2': 'EDUCATION_UIS_SDG',
-        'PV_CHLD_DPRV-S-L1-HS': 'CHLD_PVTY',
-    }
-    
     if indicator_code in KNOWN_CORRECT_DATAFLOWS:
         return KNOWN_CORRECT_DATAFLOWS[indicator_code]
     
@@ -666,7 +671,8 @@ def search_indicators(
     print(header)
     print("-" * 100)
     
-    # Print each indicator
+    # Build all indicator rows, then print the table in one call
+    rows = []
     for m in matches:
         name = m['name'][:name_width-2] + ".." if len(m['name']) > name_width else m['name']
         
@@ -676,7 +682,8 @@ def search_indicators(
             desc = m['description'][:desc_width-2] + ".." if len(m['description']) > desc_width else m['description']
             row += f"  {desc}"
         
-        print(row)
+        rows.append(row)
+    print("\n".join(rows))
     
     print("-" * 100)
     
@@ -717,8 +724,8 @@ def list_categories() -> None:
     print(f"\n  {'CATEGORY':<25} {'COUNT':>10}")
     print("-" * 50)
     
-    for cat, count in sorted_cats:
-        print(f"  {cat:<25} {count:>10}")
+    if sorted_cats:
+        print("\n".join(f"  {cat:<25} {count:>10}" for cat, count in sorted_cats))
     
     print("-" * 50)
     print(f"  {'TOTAL':<25} {sum(category_counts.values()):>10}")
@@ -26,6 +26,11 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import hashlib
+import filecmp
+import time
+from itertools import islice
+
+from unicefdata.utils import write_yaml_atomic
 
 # Package version - used in watermarks
 __version__ = "2.2.0"
@@ -69,6 +74,20 @@ class CodelistMetadata:
     name: Optional[str] = None  # Codelist's descriptive name (e.g., "Statistical Reference Areas")
 
 
+class _HashWriter:
+    """Minimal text sink that feeds everything written to it into SHA-256."""
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+
+    def write(self, text: str) -> int:
+        self._hash.update(text.encode())
+        return len(text)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
 class MetadataSync:
     """Synchronize and cache UNICEF SDMX metadata with vintage control.
     
@@ -137,11 +156,8 @@ class MetadataSync:
         self.cache_dir = Path(cache_dir)
         self.current_dir = self.cache_dir / "current"
         self.vintages_dir = self.cache_dir / "vintages"
-        
-        # Create directories
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.current_dir.mkdir(parents=True, exist_ok=True)
-        self.vintages_dir.mkdir(parents=True, exist_ok=True)
+        # Directories are created on first write, so read-only use (loading,
+        # validation, listing vintages) never touches the filesystem
         
         self.base_url = base_url or self.BASE_URL
         self.agency = agency
@@ -313,7 +329,7 @@ class MetadataSync:
             results['codelists'] = len(codelists)
             results['files_created'].append(self.FILE_CODELISTS)
             if verbose:
-                codelist_detail = ", ".join([f"{k}: {len(v.codes)}" for k, v in list(codelists.items())[:3]])
+                codelist_detail = ", ".join(f"{k}: {len(v.codes)}" for k, v in islice(codelists.items(), 3))
                 print(f"     OK {self.FILE_CODELISTS} - {len(codelists)} codelists")
                 print(f"       - {codelist_detail}...")
         except Exception as e:
@@ -359,7 +375,7 @@ class MetadataSync:
             results['files_created'].append(self.FILE_INDICATORS)
             if verbose:
                 print(f"     OK {self.FILE_INDICATORS} - {len(indicators)} indicators")
-                for df, count in list(indicators_by_dataflow.items())[:5]:
+                for df, count in islice(indicators_by_dataflow.items(), 5):
                     print(f"       - {df}: {count} indicators")
                 if len(indicators_by_dataflow) > 5:
                     print(f"       - ... and {len(indicators_by_dataflow) - 5} more dataflows")
@@ -639,8 +655,7 @@ class MetadataSync:
             'countries': results.get('countries', 0),
             'regions': results.get('regions', 0),
         }
-        with open(vintage_path / 'summary.yaml', 'w') as f:
-            yaml.dump(vintage_summary, f, default_flow_style=False)
+        write_yaml_atomic(vintage_path / 'summary.yaml', vintage_summary, default_flow_style=False)
         
         return vintage_path
     
@@ -652,12 +667,15 @@ class MetadataSync:
         """
         vintages = []
         if self.vintages_dir.exists():
-            for d in self.vintages_dir.iterdir():
-                # Check for new naming convention first, then legacy
-                has_new_format = (d / self.FILE_DATAFLOWS).exists()
-                has_legacy = (d / 'dataflows.yaml').exists()
-                if d.is_dir() and (has_new_format or has_legacy):
-                    vintages.append(d.name)
+            with os.scandir(self.vintages_dir) as entries:
+                for entry in entries:
+                    # Directory type comes from the scan itself; skip files early
+                    if not entry.is_dir():
+                        continue
+                    d = Path(entry.path)
+                    # Check for new naming convention first, then legacy
+                    if (d / self.FILE_DATAFLOWS).exists() or (d / 'dataflows.yaml').exists():
+                        vintages.append(entry.name)
         return sorted(vintages, reverse=True)
     
     def get_vintage_path(self, vintage: Optional[str] = None) -> Path:
@@ -704,25 +722,28 @@ class MetadataSync:
             'indicators': {'added': [], 'removed': [], 'changed': []},
         }
         
-        # Compare dataflows
-        df1 = self._load_yaml_from_path(path1 / 'dataflows.yaml')
-        df2 = self._load_yaml_from_path(path2 / 'dataflows.yaml')
-        
-        flows1 = set(df1.get('dataflows', {}).keys())
-        flows2 = set(df2.get('dataflows', {}).keys())
-        
-        changes['dataflows']['added'] = list(flows2 - flows1)
-        changes['dataflows']['removed'] = list(flows1 - flows2)
+        # Compare dataflows (byte-identical files cannot differ, skip parsing)
+        if not self._files_identical(path1 / 'dataflows.yaml', path2 / 'dataflows.yaml'):
+            df1 = self._load_yaml_from_path(path1 / 'dataflows.yaml')
+            df2 = self._load_yaml_from_path(path2 / 'dataflows.yaml')
+            
+            # dict key views support set algebra directly; no copies needed
+            flows1 = df1.get('dataflows', {}).keys()
+            flows2 = df2.get('dataflows', {}).keys()
+            
+            changes['dataflows']['added'] = list(flows2 - flows1)
+            changes['dataflows']['removed'] = list(flows1 - flows2)
         
         # Compare indicators
-        ind1 = self._load_yaml_from_path(path1 / 'indicators.yaml')
-        ind2 = self._load_yaml_from_path(path2 / 'indicators.yaml')
-        
-        inds1 = set(ind1.get('indicators', {}).keys())
-        inds2 = set(ind2.get('indicators', {}).keys())
-        
-        changes['indicators']['added'] = list(inds2 - inds1)
-        changes['indicators']['removed'] = list(inds1 - inds2)
+        if not self._files_identical(path1 / 'indicators.yaml', path2 / 'indicators.yaml'):
+            ind1 = self._load_yaml_from_path(path1 / 'indicators.yaml')
+            ind2 = self._load_yaml_from_path(path2 / 'indicators.yaml')
+            
+            inds1 = ind1.get('indicators', {}).keys()
+            inds2 = ind2.get('indicators', {}).keys()
+            
+            changes['indicators']['added'] = list(inds2 - inds1)
+            changes['indicators']['removed'] = list(inds1 - inds2)
         
         return changes
     
@@ -813,9 +834,9 @@ class MetadataSync:
         codelists = self.load_codelists(vintage=vintage)
         ref_area_codes = codelists.get('codelists', {}).get('CL_REF_AREA', {}).get('codes', {})
         if ref_area_codes and 'REF_AREA' in df.columns:
-            invalid_countries = set(df['REF_AREA'].unique()) - set(ref_area_codes.keys())
+            invalid_countries = set(df['REF_AREA'].unique()).difference(ref_area_codes)
             if invalid_countries:
-                issues.append(f"Invalid country codes: {list(invalid_countries)[:5]}...")
+                issues.append(f"Invalid country codes: {list(islice(invalid_countries, 5))}...")
         
         # Check for empty data
         if len(df) == 0:
@@ -832,9 +853,12 @@ class MetadataSync:
     
     def compute_data_hash(self, df) -> str:
         """Compute hash of DataFrame for version tracking."""
-        df_sorted = df.sort_values(by=list(df.columns)).reset_index(drop=True)
-        content = df_sorted.to_csv(index=False)
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        df_sorted = df.sort_values(by=list(df.columns), ignore_index=True)
+        digest = _HashWriter()
+        # Stream the CSV into the hash in chunks rather than building the whole
+        # text (and its encoded copy) in memory; the digest is unchanged.
+        df_sorted.to_csv(digest, index=False, chunksize=50_000)
+        return digest.hexdigest()[:16]
     
     def create_data_version(
         self,
@@ -903,9 +927,9 @@ class MetadataSync:
         # Keep only last 50 entries
         history['vintages'] = history['vintages'][:50]
         
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         filepath = self.cache_dir / self.FILE_SYNC_HISTORY
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(history, f, default_flow_style=False, allow_unicode=True)
+        write_yaml_atomic(filepath, history, default_flow_style=False, allow_unicode=True)
     
     # -------------------------------------------------------------------------
     # Private Helpers
@@ -921,7 +945,6 @@ class MetadataSync:
             except requests.RequestException as e:
                 if attempt == retries - 1:
                     raise
-                import time
                 time.sleep(2 ** attempt)
         return ""
     
@@ -961,15 +984,25 @@ class MetadataSync:
     
     def _save_yaml(self, filename: str, data: Dict[str, Any]) -> Path:
         """Save dictionary to YAML file in current/."""
+        self.current_dir.mkdir(parents=True, exist_ok=True)
         filepath = self.current_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        write_yaml_atomic(filepath, data, default_flow_style=False, allow_unicode=True, sort_keys=False)
         return filepath
     
     def _load_yaml(self, filename: str) -> Dict[str, Any]:
         """Load dictionary from YAML file in current/."""
         return self._load_yaml_from_path(self.current_dir / filename)
     
+    @staticmethod
+    def _files_identical(path1: Path, path2: Path) -> bool:
+        """Check whether two existing files have the same bytes.
+        
+        Compares sizes first and only reads the contents when they match.
+        """
+        if not (path1.exists() and path2.exists()):
+            return False
+        return filecmp.cmp(path1, path2, shallow=False)
+    
     def _load_yaml_from_path(self, filepath: Path) -> Dict[str, Any]:
         """Load dictionary from YAML file at given path."""
         if not filepath.exists():
@@ -3,7 +3,9 @@ import yaml
 import pandas as pd
 from typing import Dict, List, Optional, Any
 import logging
+from itertools import islice
 from unicefdata.schema_sync import get_dataflow_schema
+from unicefdata.utils import write_yaml_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,8 @@ class MetadataManager:
         # Avoids redundant YAML file reads for same dataflow
         self.schemas = {}
         self.codelists = None
+        # Column rename maps derived from cached schemas, keyed by dataflow_id
+        self.column_mappings = {}
         
     def _load_codelists(self):
         """Load codelists from codelists.yaml if not already loaded."""
@@ -104,8 +108,10 @@ class MetadataManager:
                     os.makedirs(os.path.dirname(schema_path), exist_ok=True)
                     
                     # Save schema
-                    with open(schema_path, 'w', encoding='utf-8') as f:
-                        yaml.dump(schema, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+                    write_yaml_atomic(
+                        schema_path, schema,
+                        default_flow_style=False, allow_unicode=True, sort_keys=False,
+                    )
                     
                     self.schemas[dataflow_id] = schema
                     logger.info(f"Successfully fetched and saved schema for {dataflow_id}")
@@ -143,6 +149,7 @@ class MetadataManager:
             
         warnings = []
         dimensions = {d['id']: d for d in schema.get('dimensions', [])}
+        attribute_ids = {a['id'] for a in schema.get('attributes', [])}
         
         for key, value in filters.items():
             # 1. Check if dimension exists
@@ -151,8 +158,7 @@ class MetadataManager:
                 if key == schema.get('time_dimension'):
                     continue
                 # Attributes are usually not used for filtering in SDMX, but let's check
-                is_attribute = any(a['id'] == key for a in schema.get('attributes', []))
-                if not is_attribute:
+                if key not in attribute_ids:
                     warnings.append(f"Filter key '{key}' is not a valid dimension in {dataflow_id}")
                 continue
                 
@@ -172,7 +178,7 @@ class MetadataManager:
                         if v not in valid_codes:
                             warnings.append(
                                 f"Value '{v}' for filter '{key}' is not in codelist {codelist_id}. "
-                                f"Valid codes include: {list(valid_codes.keys())[:5]}..."
+                                f"Valid codes include: {list(islice(valid_codes, 5))}..."
                             )
             
         return warnings
@@ -219,6 +225,10 @@ class MetadataManager:
         Returns:
             Dictionary mapping SDMX codes to internal names.
         """
+        # Schemas are cached per session, so the derived map is too
+        if dataflow_id in self.column_mappings:
+            return dict(self.column_mappings[dataflow_id])
+            
         schema = self.get_schema(dataflow_id)
         if not schema:
             return {}
@@ -260,7 +270,8 @@ class MetadataManager:
             else:
                 rename_map[attr_id] = attr_id.lower()
                 
-        return rename_map
+        self.column_mappings[dataflow_id] = rename_map
+        return dict(rename_map)
 
     def standardize_dataframe(self, df: pd.DataFrame, dataflow_id: str) -> pd.DataFrame:
         """
@@ -29,6 +29,7 @@ Usage:
 
 import json
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Tuple
@@ -52,7 +53,9 @@ class SchemaCacheManager:
     def __init__(self, max_size_mb: int = 100, max_age_hours: float = 24):
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.max_age_seconds = max_age_hours * 3600
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Ordered from least- to most-recently used, so eviction and expiry
+        # only ever need to look at the front of the dict
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
         self._access_times: Dict[str, float] = {}
         self._sizes: Dict[str, int] = {}
         self._current_size = 0
@@ -74,22 +77,20 @@ class SchemaCacheManager:
     def _evict_lru(self, needed_size: int) -> None:
         """Evict least-recently-used items to make space."""
         while self._current_size + needed_size > self.max_size_bytes and self._cache:
-            # Find least recently used key
-            lru_key = min(self._access_times, key=self._access_times.get)
+            lru_key, _ = self._cache.popitem(last=False)
             self._current_size -= self._sizes.pop(lru_key, 0)
-            del self._cache[lru_key]
             del self._access_times[lru_key]
     
     def _remove_expired(self) -> None:
         """Remove expired cache entries."""
         now = time.time()
-        expired_keys = [
-            key for key, cached_time in self._access_times.items()
-            if now - cached_time > self.max_age_seconds
-        ]
-        for key in expired_keys:
+        while self._cache:
+            key = next(iter(self._cache))
+            # Entries are in access order: once one is fresh, all later ones are
+            if now - self._access_times[key] <= self.max_age_seconds:
+                break
+            self._cache.popitem(last=False)
             self._current_size -= self._sizes.pop(key, 0)
-            del self._cache[key]
             del self._access_times[key]
     
     def get(self, key: str) -> Optional[Any]:
@@ -110,6 +111,7 @@ class SchemaCacheManager:
         if key not in self._cache:
             return None
         
+        self._cache.move_to_end(key)
         self._access_times[key] = time.time()
         return self._cache[key]
     
@@ -137,6 +139,7 @@ class SchemaCacheManager:
         # Remove old value if exists
         if key in self._cache:
             self._current_size -= self._sizes[key]
+            self._cache.move_to_end(key)
         
         # Store new value
         self._cache[key] = value
@@ -207,8 +210,7 @@ class SchemaCacheManager:
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Compute cache key
-            key_str = json.dumps((args, kwargs), sort_keys=True, default=str)
-            key = f"{func.__name__}:{hashlib.sha256(key_str.encode()).hexdigest()[:16]}"
+            key = f"{func.__name__}:{self._compute_hash(*args, **kwargs)}"
             
             # Try cache first
             cached = self.get(key)
@@ -15,6 +15,7 @@ Usage:
     sync_dataflow_schemas()
 """
 
+import csv
 import os
 import yaml
 import requests
@@ -24,6 +25,10 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 import logging
 import time
+from collections import Counter
+from itertools import islice
+
+from unicefdata.utils import write_yaml_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +181,21 @@ def get_dataflow_schema(dataflow_id: str, version: str = '1.0', max_retries: int
     return None
 
 
+def _iter_lines(response: requests.Response, chunk_size: int = 64 * 1024):
+    """Yield decoded lines from a streamed response without reading it all.
+    
+    Lines keep their terminators so csv can rebuild quoted multi-line fields.
+    """
+    pending = ''
+    for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
+        # The last piece is an incomplete line; hold it until more data arrives
+        *lines, pending = (pending + chunk).split('\n')
+        for line in lines:
+            yield line + '\n'
+    if pending:
+        yield pending
+
+
 def get_sample_data(
     dataflow_id: str, 
     max_rows: int = 10000, 
@@ -217,27 +237,24 @@ def get_sample_data(
             
             response.raise_for_status()
             
-            # Parse CSV - read only first max_rows lines
-            import csv
-            from io import StringIO
-            from collections import Counter
-            
-            # Get content and limit rows
-            lines = response.text.split('\n')
-            if len(lines) > max_rows + 1:  # +1 for header
-                lines = lines[:max_rows + 1]
-            
-            reader = csv.DictReader(StringIO('\n'.join(lines)))
+            # Parse CSV - read only first max_rows rows
+            # Decode the streamed body incrementally so only the sampled rows
+            # are downloaded and held in memory, not the whole dataflow
+            if response.encoding is None:
+                response.encoding = 'utf-8'
             
             # Count values for each column
             value_counts: Dict[str, Counter] = {}
             
-            for row in reader:
-                for col, val in row.items():
-                    if col not in value_counts:
-                        value_counts[col] = Counter()
-                    if val and val.strip():  # Skip empty values
-                        value_counts[col][val] += 1
+            try:
+                for row in islice(csv.DictReader(_iter_lines(response)), max_rows):
+                    for col, val in row.items():
+                        if col not in value_counts:
+                            value_counts[col] = Counter()
+                        if val and val.strip():  # Skip empty values
+                            value_counts[col][val] += 1
+            finally:
+                response.close()
             
             # Get values for each column
             result: Dict[str, Dict[str, Any]] = {}
@@ -434,8 +451,10 @@ def sync_dataflow_schemas(
             
             # Save individual dataflow schema
             df_path = os.path.join(dataflows_dir, f'{df_id}.yaml')
-            with open(df_path, 'w', encoding='utf-8') as f:
-                yaml.dump(schema_entry, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            write_yaml_atomic(
+                df_path, schema_entry,
+                default_flow_style=False, allow_unicode=True, sort_keys=False,
+            )
             
             # Add to index
             index_entries.append({
@@ -468,8 +487,10 @@ def sync_dataflow_schemas(
     }
     
     index_path = os.path.join(output_dir, 'dataflow_index.yaml')
-    with open(index_path, 'w', encoding='utf-8') as f:
-        yaml.dump(index, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    write_yaml_atomic(
+        index_path, index,
+        default_flow_style=False, allow_unicode=True, sort_keys=False,
+    )
     
     if verbose:
         print(f"\nSaved {success_count} schemas to {dataflows_dir}/")
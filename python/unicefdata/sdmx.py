@@ -207,8 +207,8 @@ def get_sdmx(
             'country_name': 'country',
             'year': 'period',
         }
-        for old, new in col_mapping.items():
-            if old in result.columns:
-                result = result.rename(columns={old: new})
+        renames = {old: new for old, new in col_mapping.items() if old in result.columns}
+        if renames:
+            result = result.rename(columns=renames)
     
     return result
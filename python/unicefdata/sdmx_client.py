@@ -34,6 +34,7 @@ Example:
 """
 
 import os
+import re
 import requests
 import pandas as pd
 import yaml
@@ -41,12 +42,18 @@ from typing import List, Optional, Union, Dict, Set
 from io import StringIO
 import time
 import logging
+import threading
 from unicefdata.metadata_manager import MetadataManager
+from unicefdata.utils import YAML_LOADER, configure_default_logging, map_concurrently
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (no-op if the application already configured it)
+configure_default_logging()
 logger = logging.getLogger(__name__)
 
+# Monthly TIME_PERIOD values: "YYYY-MM" or "YYYY-MM-DD" (month and day may be
+# unpadded). Anchored so ranges such as "2015-2019" do not match.
+_YEAR_MONTH_RE = re.compile(r"^\s*(\d{4})-(\d{1,2})(?:-\d{1,2})?\s*$")
+
 
 # ============================================================================
 # Exception Classes
@@ -162,15 +169,18 @@ class UNICEFSDMXClient:
         self.timeout = timeout
         self.session = requests.Session()
         self.metadata_manager = MetadataManager(metadata_dir=metadata_dir)
-        # Track last request for debugging/parity checks
-        self._last_url: Optional[str] = None
-        self._last_params: Optional[Dict[str, str]] = None
+        # Track last request for debugging/parity checks. Kept per thread
+        # because fetch_multiple_indicators() may fetch concurrently.
+        self._last_request = threading.local()
         # Load comprehensive indicators metadata (primary source)
         self._indicators_metadata = self._load_indicators_metadata()
         # Load canonical fallback sequences (fallback for indicators not in metadata)
         self._fallback_sequences = self._load_canonical_fallback_sequences()
         # Load region/aggregate codes for geo_type classification
         self._region_codes: Set[str] = self._load_region_codes()
+        # Enrichment lookups are parsed on first use and reused across fetches
+        self._enrichment_indicators: Optional[Dict[str, dict]] = None
+        self._enrichment_countries: Optional[Dict[str, str]] = None
         
         # Set default headers with dynamic User-Agent
         try:
@@ -202,8 +212,6 @@ class UNICEFSDMXClient:
         Returns:
             Dict mapping indicator code -> {dataflow: str, ...metadata}
         """
-        import yaml
-        import os
         
         candidates = []
         
@@ -234,7 +242,7 @@ class UNICEFSDMXClient:
             if os.path.exists(candidate):
                 try:
                     with open(candidate, 'r', encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YAML_LOADER)
                         if data and 'indicators' in data:
                             logger.info(f"Loaded comprehensive indicators metadata from: {candidate}")
                             return data['indicators']
@@ -259,8 +267,6 @@ class UNICEFSDMXClient:
         
         This ensures Python, R, and Stata all use identical dataflow resolution.
         """
-        import yaml
-        import os
         
         candidates = []
         
@@ -291,7 +297,7 @@ class UNICEFSDMXClient:
             if os.path.exists(candidate):
                 try:
                     with open(candidate, 'r', encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YAML_LOADER)
                         if data and 'fallback_sequences' in data:
                             logger.info(f"Loaded canonical fallback sequences from: {candidate}")
                             return data['fallback_sequences']
@@ -362,7 +368,7 @@ class UNICEFSDMXClient:
             if os.path.exists(candidate):
                 try:
                     with open(candidate, 'r', encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YAML_LOADER)
                         if data and 'regions' in data and isinstance(data['regions'], dict):
                             codes = set(data['regions'].keys())
                             logger.info(f"Loaded aggregate/region codes from: {candidate} ({len(codes)} codes)")
@@ -674,8 +680,8 @@ class UNICEFSDMXClient:
         if end_year:
             params["endPeriod"] = str(end_year)
         # Save for external inspection
-        self._last_url = url
-        self._last_params = params.copy()
+        self._last_request.url = url
+        self._last_request.params = params.copy()
         
         # Log request details
         if countries and len(countries) > 0:
@@ -692,12 +698,14 @@ class UNICEFSDMXClient:
                 logger.info(
                     f"API request attempt {attempt + 1}/{max_retries}: {indicator_code}"
                 )
-                logger.debug(f"URL: {url}")
-                logger.debug(f"Params: {params}")
+                logger.debug("URL: %s", url)
+                logger.debug("Params: %s", params)
                 # Build complete URL with query parameters for easy browser testing
-                param_str = "&".join([f"{k}={v}" for k, v in params.items()])
-                complete_url = f"{url}?{param_str}" if param_str else url
-                logger.info(f"Requesting SDMX CSV: {complete_url}")
+                # (only when INFO records are actually emitted)
+                if logger.isEnabledFor(logging.INFO):
+                    param_str = "&".join([f"{k}={v}" for k, v in params.items()])
+                    complete_url = f"{url}?{param_str}" if param_str else url
+                    logger.info(f"Requesting SDMX CSV: {complete_url}")
                 
                 # Make request
                 response = self.session.get(url, params=params, timeout=self.timeout)
@@ -795,6 +803,7 @@ class UNICEFSDMXClient:
         end_year: Optional[int] = None,
         dataflow: Optional[str] = None,
         combine: bool = True,
+        max_workers: int = 4,
     ) -> Union[pd.DataFrame, dict]:
         """
         Fetch multiple indicators at once
@@ -806,6 +815,10 @@ class UNICEFSDMXClient:
             end_year: End year for all indicators
             dataflow: Dataflow to use for all indicators
             combine: If True, combine into single DataFrame; if False, return dict
+            max_workers: Maximum number of indicators fetched concurrently
+                (default 4). Use 1 to fetch one at a time, e.g. when the
+                API is rate limiting. If a fetch fails, indicators not yet
+                started are skipped and the error is raised.
         
         Returns:
             Single DataFrame (if combine=True) or dict of DataFrames (if combine=False)
@@ -820,16 +833,19 @@ class UNICEFSDMXClient:
         """
         results = {}
         
-        for indicator in indicator_codes:
+        def fetch(indicator: str) -> pd.DataFrame:
             logger.info(f"Fetching indicator {indicator}...")
-            df = self.fetch_indicator(
+            return self.fetch_indicator(
                 indicator,
                 countries=countries,
                 start_year=start_year,
                 end_year=end_year,
                 dataflow=dataflow,
             )
-            
+        
+        frames = map_concurrently(fetch, indicator_codes, max_workers=max_workers)
+        
+        for indicator, df in zip(indicator_codes, frames):
             if not df.empty:
                 results[indicator] = df
             else:
@@ -976,9 +992,9 @@ class UNICEFSDMXClient:
         Returns:
             Dict mapping indicator code -> {name: str, ...metadata}
         """
-        import yaml
-        import os
-        
+        if self._enrichment_indicators is not None:
+            return self._enrichment_indicators
+
         candidates = []
         
         # Add metadata_dir if available
@@ -1002,7 +1018,7 @@ class UNICEFSDMXClient:
             if os.path.exists(candidate):
                 try:
                     with open(candidate, 'r', encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YAML_LOADER)
                         if data and 'indicators' in data:
                             logger.debug(f"Loaded indicators metadata for enrichment from: {candidate}")
                             # Convert 'name' field to standard format
@@ -1012,12 +1028,14 @@ class UNICEFSDMXClient:
                                     'name': meta.get('name', ''),
                                     **meta
                                 }
+                            self._enrichment_indicators = result
                             return result
                 except Exception as e:
                     logger.debug(f"Error loading {candidate}: {e}")
         
         logger.debug("Could not load indicators metadata for enrichment")
-        return {}
+        self._enrichment_indicators = {}
+        return self._enrichment_indicators
 
     def _load_countries_metadata_for_enrichment(self) -> Dict[str, str]:
         """
@@ -1026,9 +1044,9 @@ class UNICEFSDMXClient:
         Returns:
             Dict mapping ISO3 code -> country name
         """
-        import yaml
-        import os
-        
+        if self._enrichment_countries is not None:
+            return self._enrichment_countries
+
         candidates = []
         
         # Add metadata_dir if available
@@ -1052,15 +1070,17 @@ class UNICEFSDMXClient:
             if os.path.exists(candidate):
                 try:
                     with open(candidate, 'r', encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YAML_LOADER)
                         if data and 'countries' in data:
                             logger.debug(f"Loaded countries metadata for enrichment from: {candidate}")
-                            return data['countries']
+                            self._enrichment_countries = data['countries']
+                            return self._enrichment_countries
                 except Exception as e:
                     logger.debug(f"Error loading {candidate}: {e}")
         
         logger.debug("Could not load countries metadata for enrichment")
-        return {}
+        self._enrichment_countries = {}
+        return self._enrichment_countries
 
     def _clean_dataframe(
         self,
@@ -1129,11 +1149,9 @@ class UNICEFSDMXClient:
                     logger.warning(
                         "geo_type classification skipped: region codes not loaded; treating all as country (0)."
                     )
-                def classify_geo_type(code):
-                    if pd.isna(code):
-                        return None
-                    return 1 if str(code) in self._region_codes else 0
-                df["geo_type"] = df["iso3"].apply(classify_geo_type)
+                iso3 = df["iso3"]
+                is_region = iso3.astype(str).isin(self._region_codes).astype(int)
+                df["geo_type"] = is_region.where(iso3.notna())
             elif "geo_type" in df.columns:
                 df["geo_type"] = pd.to_numeric(df["geo_type"], errors="coerce")
             else:
@@ -1157,24 +1175,21 @@ class UNICEFSDMXClient:
                     """Convert TIME_PERIOD to decimal year (YYYY-MM -> YYYY + MM/12)"""
                     if pd.isna(val):
                         return None
-                    val_str = str(val)
                     # Check for YYYY-MM format
-                    if '-' in val_str and len(val_str) >= 7:
-                        parts = val_str.split('-')
-                        if len(parts) >= 2:
-                            try:
-                                year = int(parts[0])
-                                month = int(parts[1])
-                                return year + month / 12
-                            except (ValueError, IndexError):
-                                pass
+                    match = _YEAR_MONTH_RE.match(str(val))
+                    if match:
+                        return int(match.group(1)) + int(match.group(2)) / 12
                     # Try direct numeric conversion for YYYY format
                     try:
                         return float(val)
                     except (ValueError, TypeError):
                         return None
                 
-                df["period"] = df["period"].apply(convert_period_to_decimal)
+                # Periods repeat across countries; convert each distinct value once
+                period_values = df["period"].unique()
+                df["period"] = df["period"].map(
+                    dict(zip(period_values, map(convert_period_to_decimal, period_values)))
+                )
             
             if "lower_bound" in df.columns:
                 df["lower_bound"] = pd.to_numeric(df["lower_bound"], errors="coerce")
@@ -1379,7 +1394,7 @@ class UNICEFSDMXClient:
             
             # Sort by country and period
             if "iso3" in df.columns and "period" in df.columns:
-                df = df.sort_values(["iso3", "period"]).reset_index(drop=True)
+                df = df.sort_values(["iso3", "period"], ignore_index=True)
             
             return df
             
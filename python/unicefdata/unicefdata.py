@@ -14,6 +14,7 @@ Cross-platform alignment: R, Python, Stata all use identical:
 """
 
 import logging
+import warnings
 from typing import List, Optional, Union, Tuple, Dict
 import pandas as pd
 import yaml
@@ -29,6 +30,9 @@ from unicefdata.utils import (
     get_country_regions,
     get_income_groups,
     get_continents,
+    configure_default_logging,
+    map_concurrently,
+    YAML_LOADER,
 )
 from unicefdata.indicator_registry import (
     get_dataflow_for_indicator,
@@ -40,8 +44,8 @@ from unicefdata.sdmx_client import (
 )
 from unicefdata.metadata import MetadataSync
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (no-op if the application already configured it)
+configure_default_logging()
 logger = logging.getLogger(__name__)
 
 __all__ = ['unicefData', 'unicefdata', 'parse_year']
@@ -166,14 +170,14 @@ def _apply_circa(df: pd.DataFrame, target_years: List[int]) -> pd.DataFrame:
     
     for target in target_years:
         # For each country(-indicator), find the observation closest to target
-        for _, group in df.groupby(group_cols):
-            if group.empty:
-                continue
-            # Find index of closest period to target
-            idx = (group['period'] - target).abs().idxmin()
-            closest_row = group.loc[[idx]].copy()
-            closest_row['target_year'] = target
-            results.append(closest_row)
+        # with a single grouped reduction over the period distances
+        distance = (df['period'] - target).abs()
+        idx = distance.groupby([df[c] for c in group_cols]).idxmin()
+        if idx.empty:
+            continue
+        closest_rows = df.loc[idx.values].copy()
+        closest_rows['target_year'] = target
+        results.append(closest_rows)
     
     if not results:
         return df.head(0)  # Empty with same columns
@@ -234,7 +238,7 @@ def _load_fallback_sequences() -> Dict[str, List[str]]:
     
     try:
         with open(fallback_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
             
         if 'fallback_sequences' in data:
             return data['fallback_sequences']
@@ -273,8 +277,6 @@ def _load_indicators_metadata() -> Dict[str, dict]:
             ...
         }
     """
-    import os
-    
     candidates = []
     
     # Get the repository root (parent of python/)
@@ -307,7 +309,7 @@ def _load_indicators_metadata() -> Dict[str, dict]:
         try:
             logger.info(f"Attempting to load indicators metadata from: {candidate}")
             with open(candidate, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YAML_LOADER)
                 if data and 'indicators' in data:
                     num_indicators = len(data['indicators'])
                     logger.info(f"✅ Loaded comprehensive indicators metadata: {num_indicators} indicators from {candidate.name}")
@@ -337,8 +339,8 @@ def clear_cache(reload: bool = True, verbose: bool = True) -> list:
     """Clear all in-memory caches across the unicefdata package.
 
     Resets module-level caches for fallback sequences, indicators metadata,
-    the global SDMX client instance, indicator registry cache, and config
-    cache. After clearing, the next API call will reload all metadata from
+    the global SDMX client instance, indicator registry cache, config cache,
+    and parsed dataflow schemas. After clearing, the next API call will reload all metadata from
     YAML files (or fetch fresh from the API if file cache is stale).
 
     Args:
@@ -380,6 +382,11 @@ def clear_cache(reload: bool = True, verbose: bool = True) -> list:
     except ImportError:
         pass
 
+    # 6. Dataflow schema cache (flows.py, shares the utils YAML cache)
+    from unicefdata.utils import clear_yaml_cache
+    clear_yaml_cache()
+    cleared.append("dataflow_schemas")
+
     if verbose:
         msg = f"Cleared {len(cleared)} caches: {', '.join(cleared)}"
         if reload:
@@ -566,6 +573,7 @@ def _fetch_with_fallback(
     max_retries: int = 3,
     tidy: bool = True,
     totals: bool = False,
+    max_workers: int = 4,
 ) -> pd.DataFrame:
     """
     Fetch multiple indicators using get_sdmx() with fallback logic.
@@ -582,6 +590,8 @@ def _fetch_with_fallback(
         sex: Sex disaggregation
         max_retries: Number of retries per dataflow
         tidy: Whether to return cleaned data
+        max_workers: Maximum number of indicators fetched concurrently
+            (1 = sequential)
         
     Returns:
         Combined DataFrame with all indicator data
@@ -592,9 +602,8 @@ def _fetch_with_fallback(
     if _client is None:
         _client = UNICEFSDMXClient()
     
-    dfs = []
-    for ind in indicators:
-        df = _fetch_indicator_with_fallback(
+    def fetch(ind: str) -> pd.DataFrame:
+        return _fetch_indicator_with_fallback(
             client=_client,
             indicator_code=ind,
             dataflow=dataflow,
@@ -605,8 +614,11 @@ def _fetch_with_fallback(
             max_retries=max_retries,
             tidy=tidy,
         )
-        if not df.empty:
-            dfs.append(df)
+    
+    # Indicators are independent network requests; fetch them concurrently.
+    # Results keep the requested order; a failure stops queued fetches.
+    frames = map_concurrently(fetch, indicators, max_workers=max_workers)
+    dfs = [df for df in frames if not df.empty]
     
     if not dfs:
         return pd.DataFrame()
@@ -646,6 +658,7 @@ def unicefData(
     mrv: Optional[int] = None,
     raw: bool = False,
     ignore_duplicates: bool = False,
+    max_workers: int = 4,
 ) -> pd.DataFrame:
     """
     Fetch UNICEF indicator data from SDMX API.
@@ -712,6 +725,10 @@ def unicefData(
         ignore_duplicates: If False (default), raises an error when exact duplicate
             rows are found (all column values identical). Set to True to allow 
             automatic removal of duplicates.
+        max_workers: Maximum number of indicators fetched concurrently when
+            several are requested (default 4). Use 1 to fetch one at a time,
+            e.g. when the API is rate limiting. If a fetch fails, indicators
+            not yet started are skipped and the error is raised.
     
     Returns:
         pandas.DataFrame with columns (varies by options):
@@ -855,6 +872,7 @@ def unicefData(
         totals=totals,
         max_retries=max_retries,
         tidy=not raw,
+        max_workers=max_workers,
     )
     
     print("")
@@ -880,9 +898,16 @@ def unicefData(
         'OBS_VALUE': 'value',
         'country_name': 'country',
     }
+    # Resolve all renames against a column set, then rename once
+    columns = set(result.columns)
+    renames = {}
     for old, new in col_mapping.items():
-        if old in result.columns and new not in result.columns:
-            result = result.rename(columns={old: new})
+        if old in columns and new not in columns:
+            renames[old] = new
+            columns.discard(old)
+            columns.add(new)
+    if renames:
+        result = result.rename(columns=renames)
     
     # Ensure period is numeric
     if 'period' in result.columns:
@@ -920,7 +945,6 @@ def unicefData(
             else:
                 # Remove exact duplicates, keeping first occurrence
                 result = result.drop_duplicates(keep='first')
-                import warnings
                 warnings.warn(
                     f"Removed {n_duplicates} exact duplicate rows (all values identical).",
                     UserWarning
@@ -1013,15 +1037,22 @@ def _add_indicator_metadata(df: pd.DataFrame, metadata_list: List[str]) -> pd.Da
         return df
     
     if 'indicator_name' in metadata_list or 'indicator_category' in metadata_list:
-        # Get indicator info from registry
-        unique_indicators = df['indicator'].unique()
-        for ind in unique_indicators:
+        # Get indicator info from registry (one lookup per distinct code)
+        names = {}
+        categories = {}
+        for ind in df['indicator'].unique():
             info = get_indicator_info(ind)
             if info:
-                if 'indicator_name' in metadata_list:
-                    df.loc[df['indicator'] == ind, 'indicator_name'] = info.get('name', '')
-                if 'indicator_category' in metadata_list:
-                    df.loc[df['indicator'] == ind, 'indicator_category'] = info.get('category', '')
+                names[ind] = info.get('name', '')
+                categories[ind] = info.get('category', '')
+        
+        # Map all rows at once; rows without registry info keep existing values
+        for col, lookup in (('indicator_name', names), ('indicator_category', categories)):
+            if col in metadata_list and lookup:
+                mapped = df['indicator'].map(lookup)
+                if col in df.columns:
+                    mapped = mapped.where(df['indicator'].isin(list(lookup)), df[col])
+                df[col] = mapped
     
     return df
 
@@ -15,6 +15,10 @@ STRUCTURE:
     6. Data Transformation - pivot_wide
     7. Data Analysis - calculate_growth_rate
     8. Reference Data - get_country_regions, get_income_groups, get_continents
+    9. File Output - write_yaml_atomic
+    10. Module Setup - YAML_LOADER, configure_default_logging
+    11. Concurrency - map_concurrently
+    12. Cached YAML Parsing - load_yaml_cached, clear_yaml_cache
 
 Version: 2.0.0 (2026-01-31)
 Author: João Pedro Azevedo (UNICEF)
@@ -25,8 +29,15 @@ License: MIT
 # #### 1. Imports ####
 # =============================================================================
 
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import List, Optional, Set
+import yaml
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Set, TypeVar, Union
 import re
 
 
@@ -614,3 +625,158 @@ def get_continents() -> dict:
         'SLB': 'Oceania', 'TON': 'Oceania', 'TUV': 'Oceania', 'VUT': 'Oceania',
     }
     return continents
+
+
+# =============================================================================
+# #### 9. File Output ####
+# =============================================================================
+
+
+def write_yaml_atomic(path: Union[str, Path], data: Any, **dump_kwargs) -> None:
+    """
+    Write data to a YAML file, replacing any existing file atomically.
+    
+    The document is dumped to a temporary file in the same directory and then
+    moved over the target with os.replace(). Readers see either the old file
+    or the complete new one, never a partially written cache, even if the
+    process is interrupted or several writers race on the same path.
+    
+    Args:
+        path: Destination file path
+        data: Object to serialize
+        **dump_kwargs: Passed through to yaml.dump()
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# =============================================================================
+# #### 10. Module Setup ####
+# =============================================================================
+
+# Prefer PyYAML's libyaml-backed loader when available: the metadata files
+# the package reads run to several hundred KB and parse several times faster in C.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def configure_default_logging() -> None:
+    """
+    Show the package's INFO messages when the application has not set up logging.
+    
+    Installs a stderr handler on the root logger and sets the 'unicefdata'
+    logger to INFO, but only if the root logger has no handlers and the
+    package logger's level is still unset. An application that configured
+    logging before importing the package keeps its levels and handlers.
+    Other libraries stay at the root's default WARNING level.
+    
+    Because the package logger then has its own level, changing only the
+    root level after import does not affect it. Adjust it directly, e.g.
+    logging.getLogger("unicefdata").setLevel(logging.WARNING).
+    """
+    package_logger = logging.getLogger("unicefdata")
+    if logging.getLogger().handlers or package_logger.level != logging.NOTSET:
+        return
+    logging.basicConfig()
+    package_logger.setLevel(logging.INFO)
+
+
+# =============================================================================
+# #### 11. Concurrency ####
+# =============================================================================
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Placeholder result for calls skipped after another call failed
+_SKIPPED = object()
+
+
+def map_concurrently(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int = 1,
+) -> List[_R]:
+    """
+    Apply func to each item, running up to max_workers calls at once.
+    
+    Results come back in input order. With max_workers <= 1 the calls run
+    one after another in the calling thread. If a call raises, items that
+    have not started yet are skipped, calls already running are allowed to
+    finish, and the exception of the earliest failing item is re-raised.
+    
+    Args:
+        func: Function applied to each item
+        items: Inputs to func
+        max_workers: Maximum number of concurrent calls (1 = sequential)
+    
+    Returns:
+        List of func(item) results, in the order of items
+    """
+    items = list(items)
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    
+    failed = threading.Event()
+    
+    def call(item):
+        # Once a call has failed, do not start the remaining ones
+        if failed.is_set():
+            return _SKIPPED
+        try:
+            return func(item)
+        except BaseException:
+            failed.set()
+            raise
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(call, item) for item in items]
+    
+    for future in futures:
+        if future.exception() is not None:
+            raise future.exception()
+    return [future.result() for future in futures]
+
+
+# =============================================================================
+# #### 12. Cached YAML Parsing ####
+# =============================================================================
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_file(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; memoized on (path, mtime) so edits are picked up."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def load_yaml_cached(path: Union[str, Path]) -> Any:
+    """
+    Parse a YAML file, reusing the result until the file's mtime changes.
+    
+    The returned object is shared between calls and must not be modified.
+    Deep-copy it before handing it to callers that may change it.
+    
+    Args:
+        path: YAML file to read
+    
+    Returns:
+        Parsed YAML content
+    """
+    path = str(path)
+    return _parse_yaml_file(path, os.stat(path).st_mtime_ns)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all files memoized by load_yaml_cached()."""
+    _parse_yaml_file.cache_clear()
@@ -14,6 +14,7 @@ Usage:
     yaml_str = formatter.dumps(data)
 """
 
+import os
 import yaml
 from datetime import datetime, timezone
 from pathlib import Path
@@ -149,6 +150,9 @@ class YAMLFormatter:
         """
         Read, reformat, and write a YAML file with standard formatting.
         
+        The output file is only rewritten when its content would change, so
+        already-normalized files keep their modification time.
+        
         Args:
             input_path: Path to input YAML file
             output_path: Path to output file (defaults to input_path)
@@ -157,10 +161,23 @@ class YAMLFormatter:
         output_path = Path(output_path) if output_path else input_path
         
         with open(input_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            original = f.read()
+        
+        formatted = self.dumps(yaml.safe_load(original))
+        
+        if output_path == input_path:
+            current = original
+        elif output_path.is_file():
+            with open(output_path, 'r', encoding='utf-8') as f:
+                current = f.read()
+        else:
+            current = None
+        
+        if formatted == current:
+            return
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(self.dumps(data))
+            f.write(formatted)
     
     def create_metadata_header(
         self,
@@ -279,6 +296,25 @@ class YAMLFormatter:
         return datetime.now(timezone.utc).isoformat()
 
 
+def _find_yaml_files(directory: Path, recursive: bool = True) -> List[Path]:
+    """Collect ``*.yaml`` files with one ``os.scandir`` pass per directory."""
+    if not directory.is_dir():
+        return []
+    
+    files = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.yaml') and entry.is_file():
+                files.append(Path(entry.path))
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(Path(entry.path))
+    
+    for subdir in subdirs:
+        files.extend(_find_yaml_files(subdir, recursive))
+    return files
+
+
 def normalize_yaml_files(
     directory: Union[str, Path],
     recursive: bool = True,
@@ -296,8 +332,7 @@ def normalize_yaml_files(
     directory = Path(directory)
     formatter = YAMLFormatter()
     
-    pattern = '**/*.yaml' if recursive else '*.yaml'
-    files = list(directory.glob(pattern))
+    files = _find_yaml_files(directory, recursive)
     
     for file_path in files:
         try: